@@ -728,22 +728,17 @@ const PredictionView = ({ T, userId, isAuthReady, setCurrentPage }) => {
         setMarketInsights(null);
 
         try {
-            const predictRes = await fetch(`${API_BASE_URL}/predict`, {
+            // Prediction and market insights come back together from /advise.
+            const adviseRes = await fetch(`${API_BASE_URL}/advise`, {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify(formData)
             });
             
-            if (!predictRes.ok) throw new Error("Prediction failed");
-            const predictData = await predictRes.json();
-            const crop = predictData.suggested_crop;
-            setPrediction(crop);
-
-            const insightRes = await fetch(`${API_BASE_URL}/market-insights?crop_name=${crop}`);
-            if (insightRes.ok) {
-                const insightData = await insightRes.json();
-                setMarketInsights(insightData);
-            }
+            if (!adviseRes.ok) throw new Error("Prediction failed");
+            const adviseData = await adviseRes.json();
+            setPrediction(adviseData.suggested_crop);
+            setMarketInsights(adviseData.insights);
         } catch (err) {
             console.error(err);
             setError(T.ERROR_API);
@@ -0,0 +1,202 @@
+"""Prediction history and the ``/analytics`` chart data built from it.
+
+Each prediction is appended to ``prediction_events``. In the same
+transaction, its (month, location, crop) row in ``prediction_rollups`` is
+incremented. Dashboard reads only touch the rollups, whose size depends on
+months x locations x crops and not on the number of events.
+
+``record`` and ``record_many`` only queue events. A single flusher task
+writes everything queued so far in one transaction, so a burst of
+predictions, or a whole batch request, costs one commit instead of one
+commit each.
+"""
+import asyncio
+import logging
+import re
+import time
+from collections import Counter, defaultdict
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from _db import SQLitePool, transaction
+
+if TYPE_CHECKING:
+    import sqlite3
+
+logger = logging.getLogger(__name__)
+
+MONTH_PATTERN = re.compile(r"^\d{4}-(0[1-9]|1[0-2])$")
+
+# Colors from the original mock charts, extended for more crops.
+CHART_COLORS = ['#059669', '#F59E0B', '#FCD34D', '#10B981', '#3B82F6', '#8B5CF6', '#EC4899', '#EF4444', '#9CA3AF']
+TOP_CROPS = 8
+MAX_MONTHS = 120
+
+Event = Tuple[float, str, str, str, int]
+
+
+def parse_profit(profit: str) -> int:
+    """``"₹10,00,000"`` -> ``1000000``."""
+    digits = re.sub(r"\D", "", profit or "")
+    return int(digits) if digits else 0
+
+
+def month_of(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m")
+
+
+def month_range(start: str, end: str) -> List[str]:
+    year, month = int(start[:4]), int(start[5:])
+    months = []
+    while f"{year:04d}-{month:02d}" <= end:
+        months.append(f"{year:04d}-{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def shift_month(value: str, delta: int) -> str:
+    index = int(value[:4]) * 12 + int(value[5:]) - 1 + delta
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+def resolve_range(start: Optional[str], end: Optional[str]) -> Tuple[str, str]:
+    """Validate a ``YYYY-MM`` range; defaults to the six months ending with the current one."""
+    for value in (start, end):
+        if value is not None and not MONTH_PATTERN.match(value):
+            raise ValueError("start and end must be months in YYYY-MM format")
+    end = end or date.today().strftime("%Y-%m")
+    start = start or shift_month(end, -5)
+    if start > end:
+        raise ValueError("start must not be after end")
+    if shift_month(start, MAX_MONTHS - 1) < end:
+        raise ValueError(f"range must not exceed {MAX_MONTHS} months")
+    return start, end
+
+
+class PredictionAnalytics:
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS prediction_events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            ts REAL NOT NULL,
+            month TEXT NOT NULL,
+            location TEXT NOT NULL,
+            crop TEXT NOT NULL,
+            profit INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS prediction_rollups (
+            month TEXT NOT NULL,
+            location TEXT NOT NULL,
+            crop TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            profit_sum INTEGER NOT NULL,
+            PRIMARY KEY (month, location, crop)
+        );
+    """
+
+    def __init__(self, path: str, crop_details: Dict[str, Dict[str, Any]], pool_size: int = 2):
+        self.pool = SQLitePool(path, self.SCHEMA, pool_size)
+        self.crop_details = crop_details
+        self._profits: Optional[Dict[str, int]] = None
+        self._pending: List[Event] = []
+        self._flusher: Optional[asyncio.Task] = None
+
+    def record(self, crop: str, location: Optional[str]) -> None:
+        """Queue one prediction; it is written by the background flusher."""
+        self.record_many([crop], [location])
+
+    def record_many(self, crops: Sequence[str], locations: Sequence[Optional[str]]) -> None:
+        """Queue a batch of predictions, all stamped with the current time."""
+        now = time.time()
+        month = month_of(now)
+        if self._profits is None:
+            self._profits = {name: parse_profit(details.get("profit", "")) for name, details in self.crop_details.items()}
+        profits = self._profits
+        self._pending.extend(
+            (now, month, location or "", crop, profits.get(crop, 0)) for crop, location in zip(crops, locations)
+        )
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.ensure_future(self._flush())
+
+    async def _flush(self) -> None:
+        while self._pending:
+            batch, self._pending = self._pending, []
+            try:
+                await self.pool.run(transaction, self._write, batch)
+            except Exception:
+                logger.exception("Dropped %d prediction events that could not be written", len(batch))
+
+    async def flushed(self) -> None:
+        """Wait until every queued event has been written."""
+        if self._flusher is not None and not self._flusher.done():
+            await asyncio.shield(self._flusher)
+
+    @staticmethod
+    def _write(conn: "sqlite3.Connection", batch: List[Event]) -> None:
+        conn.executemany(
+            "INSERT INTO prediction_events (ts, month, location, crop, profit) VALUES (?, ?, ?, ?, ?)", batch
+        )
+        rollups: Dict[Tuple[str, str, str], List[int]] = defaultdict(lambda: [0, 0])
+        for _, month, location, crop, profit in batch:
+            totals = rollups[(month, location, crop)]
+            totals[0] += 1
+            totals[1] += profit
+        conn.executemany(
+            "INSERT INTO prediction_rollups (month, location, crop, count, profit_sum) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(month, location, crop) DO UPDATE SET "
+            "count = count + excluded.count, profit_sum = profit_sum + excluded.profit_sum",
+            [(month, location, crop, count, profit) for (month, location, crop), (count, profit) in rollups.items()],
+        )
+
+    @staticmethod
+    def _read(conn: "sqlite3.Connection", start: str, end: str, location: Optional[str]):
+        query = (
+            "SELECT month, crop, SUM(count), SUM(profit_sum) FROM prediction_rollups "
+            "WHERE month BETWEEN ? AND ?"
+        )
+        params: List[Any] = [start, end]
+        if location is not None:
+            query += " AND location = ?"
+            params.append(location)
+        return conn.execute(query + " GROUP BY month, crop", params).fetchall()
+
+    async def charts(self, start: str, end: str, location: Optional[str] = None) -> Dict[str, Any]:
+        """Chart.js datasets in the shape the dashboard already renders."""
+        await self.flushed()
+        rows = await self.pool.run(self._read, start, end, location)
+
+        monthly_count: Counter = Counter()
+        monthly_profit: Counter = Counter()
+        crop_count: Counter = Counter()
+        for month, crop, count, profit_sum in rows:
+            monthly_count[month] += count
+            monthly_profit[month] += profit_sum
+            crop_count[crop] += count
+
+        months = month_range(start, end)
+        top = crop_count.most_common(TOP_CROPS)
+        other = sum(crop_count.values()) - sum(count for _, count in top)
+        if other:
+            top.append(("Other", other))
+
+        return {
+            "profitTrend": {
+                "labels": [datetime.strptime(m, "%Y-%m").strftime("%b %Y") for m in months],
+                "datasets": [{
+                    "label": 'Avg. Expected Profit (₹)',
+                    "data": [round(monthly_profit[m] / monthly_count[m]) if monthly_count[m] else 0 for m in months],
+                    "borderColor": '#10B981',
+                    "tension": 0.4,
+                    "pointBackgroundColor": '#059669',
+                }],
+            },
+            "cropFrequency": {
+                "labels": [crop for crop, _ in top],
+                "datasets": [{
+                    "label": 'Crop Frequency',
+                    "data": [count for _, count in top],
+                    "backgroundColor": [CHART_COLORS[i % len(CHART_COLORS)] for i in range(len(top))],
+                    "hoverOffset": 4,
+                }],
+            },
+            "range": {"start": start, "end": end, "location": location, "predictions": sum(monthly_count.values())},
+        }
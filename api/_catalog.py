@@ -0,0 +1,195 @@
+"""Crop catalog data and the JSON bodies served for it.
+
+The catalog is read from ``crops.json``, a compact artifact generated from
+``_crop_data.py``. Nothing is loaded or encoded until the first request
+needs it, which keeps serverless cold starts short.
+"""
+import hashlib
+import json
+import os
+import zlib
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from fastapi import Request, Response
+
+API_DIR = os.path.dirname(os.path.abspath(__file__))
+CROP_SOURCE_PATH = os.path.join(API_DIR, "_crop_data.py")
+CROP_ARTIFACT_PATH = os.path.join(API_DIR, "crops.json")
+
+SOIL_TYPES = ["Clay", "Loam", "Silt", "Sandy", "Red", "Peat"]
+
+CACHE_CONTROL = "public, max-age=300"
+
+
+def crop_source_digest() -> str:
+    with open(CROP_SOURCE_PATH, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def build_crop_artifact(path: str = CROP_ARTIFACT_PATH) -> str:
+    from _crop_data import CROP_DETAILS
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"source_sha1": crop_source_digest(), "crops": CROP_DETAILS}, f, ensure_ascii=False, separators=(",", ":"))
+    return path
+
+
+def load_crop_details() -> Dict[str, Dict[str, Any]]:
+    """Read the prebuilt artifact, or import the source if the artifact is
+    missing or was built from a different version of ``_crop_data.py``."""
+    try:
+        with open(CROP_ARTIFACT_PATH, encoding="utf-8") as f:
+            artifact = json.load(f)
+        if artifact.get("source_sha1") == crop_source_digest():
+            return artifact["crops"]
+    except (OSError, ValueError):
+        pass
+    from _crop_data import CROP_DETAILS
+    return CROP_DETAILS
+
+
+class LazyCropDetails(Mapping):
+    """Read-only crop catalog mapping that loads itself on first access."""
+
+    def __init__(self, loader=load_crop_details):
+        self._loader = loader
+        self._data: Optional[Dict[str, Dict[str, Any]]] = None
+
+    @property
+    def data(self) -> Dict[str, Dict[str, Any]]:
+        if self._data is None:
+            self._data = self._loader()
+        return self._data
+
+    def __getitem__(self, name: str) -> Dict[str, Any]:
+        return self.data[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+
+def stable_soil_type(crop_name: str) -> str:
+    """Soil type for crops that do not declare one; fixed per name so responses are cacheable."""
+    return SOIL_TYPES[zlib.crc32(crop_name.encode("utf-8")) % len(SOIL_TYPES)]
+
+
+def encode_json(content: Any) -> bytes:
+    # Same settings as Starlette's JSONResponse, so clients see identical bytes.
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def accepted_encodings(accept_encoding: str) -> List[str]:
+    encodings = []
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        params = params.replace(" ", "")
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        encodings.append(coding.strip().lower())
+    return encodings
+
+
+class EncodedBody:
+    """A JSON body with its precompressed variants and ETags."""
+
+    def __init__(self, content: Any):
+        import gzip
+
+        try:
+            import brotli
+        except ImportError:  # optional: brotli responses are skipped without it
+            brotli = None
+
+        self.identity = encode_json(content)
+        digest = hashlib.sha1(self.identity).hexdigest()[:20]
+        self.variants = {None: (self.identity, f'"{digest}"')}
+        gzipped = gzip.compress(self.identity, compresslevel=9, mtime=0)
+        if len(gzipped) < len(self.identity):
+            self.variants["gzip"] = (gzipped, f'"{digest}-gz"')
+        if brotli is not None:
+            brotlied = brotli.compress(self.identity, quality=11)
+            if len(brotlied) < len(self.identity):
+                self.variants["br"] = (brotlied, f'"{digest}-br"')
+        self.etags = {etag for _, etag in self.variants.values()}
+
+    def not_modified(self, if_none_match: str) -> bool:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or not self.etags.isdisjoint(tags)
+
+    def respond(self, request: Request) -> Response:
+        encodings = accepted_encodings(request.headers.get("accept-encoding", ""))
+        encoding = next((e for e in ("br", "gzip") if e in self.variants and e in encodings), None)
+        body, etag = self.variants[encoding]
+        headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL, "Vary": "Accept-Encoding"}
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and self.not_modified(if_none_match):
+            return Response(status_code=304, headers=headers)
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        return Response(content=body, media_type="application/json", headers=headers)
+
+
+class CropCatalog:
+    """Encoded catalog responses, each built the first time it is requested."""
+
+    def __init__(self, crop_details: Mapping):
+        self.crop_details = crop_details
+        self._list_body: Optional[EncodedBody] = None
+        self._crop_bodies: Dict[str, EncodedBody] = {}
+
+    def crops_list(self) -> List[Dict[str, Any]]:
+        crops_list = []
+        for name, details in self.crop_details.items():
+            crop_item = details.copy()
+            crop_item['name'] = name
+            if 'soil_type' not in crop_item:
+                crop_item['soil_type'] = stable_soil_type(name)
+            crops_list.append(crop_item)
+        return crops_list
+
+    @property
+    def list_body(self) -> EncodedBody:
+        if self._list_body is None:
+            self._list_body = EncodedBody(self.crops_list())
+        return self._list_body
+
+    def crop_body(self, crop_name: str) -> Optional[EncodedBody]:
+        body = self._crop_bodies.get(crop_name)
+        if body is None:
+            details = self.crop_details.get(crop_name)
+            if details is None:
+                return None
+            body = self._crop_bodies[crop_name] = EncodedBody(details)
+        return body
+
+
+# ``requirements`` keys mapped to the ``PredictionInput`` fields they constrain.
+REQUIREMENT_FIELDS = {
+    "temp": "temperature",
+    "rainfall": "rainfall",
+    "ph": "phLevel",
+    "n": "nLevel",
+    "p": "pLevel",
+    "k": "kLevel",
+}
+
+
+def requirement_ranges(details: Dict[str, Any]) -> Dict[str, Tuple[float, float]]:
+    """Parse a crop's ``"lo-hi"`` requirement strings into ``{field: (lo, hi)}``."""
+    ranges = {}
+    for key, value in details.get("requirements", {}).items():
+        field = REQUIREMENT_FIELDS.get(key)
+        if field is None:
+            continue
+        lo, _, hi = value.partition("-")
+        ranges[field] = (float(lo), float(hi or lo))
+    return ranges
@@ -0,0 +1,73 @@
+"""Pooled SQLite connections for use from async handlers."""
+import asyncio
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import sqlite3
+
+
+class SQLitePool:
+    """SQLite in WAL mode, so readers never block the writer and several
+    worker processes can share one database file.
+
+    Queries run in worker threads on up to ``size`` connections, so the
+    event loop never waits on disk I/O. Connections are opened on first use
+    and each one runs ``schema`` when it is opened. ``sqlite3`` itself is
+    only imported then, which keeps it off the import path.
+    """
+
+    def __init__(self, path: str, schema: str, size: int = 4):
+        self.path = path
+        self.schema = schema
+        self.size = size
+        self._pool = None
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    def _connect(self) -> "sqlite3.Connection":
+        import sqlite3
+
+        conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(self.schema)
+        return conn
+
+    def _acquire(self) -> "sqlite3.Connection":
+        with self._lock:
+            if self._pool is None:
+                import queue
+
+                self._pool = queue.LifoQueue()
+            if self._pool.empty() and self._opened < self.size:
+                self._opened += 1
+                try:
+                    return self._connect()
+                except Exception:
+                    self._opened -= 1
+                    raise
+        return self._pool.get()
+
+    def _run(self, fn, *args):
+        conn = self._acquire()
+        try:
+            return fn(conn, *args)
+        finally:
+            self._pool.put(conn)
+
+    async def run(self, fn, *args):
+        """Call ``fn(connection, *args)`` in a worker thread."""
+        return await asyncio.to_thread(self._run, fn, *args)
+
+
+def transaction(conn: "sqlite3.Connection", fn, *args):
+    """Run ``fn(conn, *args)`` inside ``BEGIN IMMEDIATE`` ... ``COMMIT``."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        result = fn(conn, *args)
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    return result
@@ -0,0 +1,121 @@
+"""Market-insight providers and the async TTL cache in front of them."""
+import asyncio
+import importlib
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class InsightProvider:
+    """Computes the ``/market-insights`` payload for a crop and location.
+
+    Subclass and override ``get_insights``; point ``AGRIOPTIMA_INSIGHT_PROVIDER``
+    at a ``module:factory`` that returns the instance to plug it in.
+    """
+
+    async def get_insights(self, crop_name: str, location: Optional[str]) -> Dict[str, Any]:
+        raise NotImplementedError
+
+
+class MockInsightProvider(InsightProvider):
+    """Canned forecast plus profit/risk derived from the crop catalog."""
+
+    def __init__(self, crop_details: Dict[str, Dict[str, Any]]):
+        self.crop_details = crop_details
+
+    async def get_insights(self, crop_name: str, location: Optional[str]) -> Dict[str, Any]:
+        weather_summary = f"Forecast for {location}: Next 7 days expect avg high of 28°C and 60% humidity. Light rainfall expected on Day 3."
+        details = self.crop_details.get(crop_name, self.crop_details['Rice'])
+        profit = details['profit']
+        risk = "Low"
+        if '3,50,000' in profit or '10,00,000' in profit:
+            risk = "High"
+        elif '2,00,000' in profit:
+            risk = "Medium"
+        return {
+            "weather": weather_summary,
+            "profit": profit,
+            "risk": risk
+        }
+
+
+def load_insight_provider(crop_details: Dict[str, Dict[str, Any]]) -> InsightProvider:
+    spec = os.environ.get("AGRIOPTIMA_INSIGHT_PROVIDER")
+    if not spec:
+        return MockInsightProvider(crop_details)
+    module_name, _, attr = spec.partition(":")
+    factory = getattr(importlib.import_module(module_name), attr or "provider")
+    return factory(crop_details) if callable(factory) else factory
+
+
+class AsyncTTLCache:
+    """LRU cache with per-entry expiry and request coalescing.
+
+    Concurrent ``get_or_compute`` calls for the same key share one in-flight
+    computation. Failed computations are not cached, and neither are results
+    of computations started before the last ``clear``.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    async def get_or_compute(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > self.clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(self._compute(key, compute, self._generation))
+            self._inflight[key] = task
+        # Shield so a disconnecting client does not cancel the shared computation.
+        return await asyncio.shield(task)
+
+    async def _compute(self, key: Hashable, compute: Callable[[], Awaitable[Any]], generation: int) -> Any:
+        try:
+            value = await compute()
+            if generation != self._generation:
+                return value  # cleared while computing; the result may be stale
+            self._entries[key] = (self.clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return value
+        finally:
+            if generation == self._generation:
+                del self._inflight[key]
+
+    def clear(self) -> None:
+        """Drop cached entries; computations already running are not cached."""
+        self._generation += 1
+        self._entries.clear()
+        self._inflight.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+        }
@@ -0,0 +1,241 @@
+"""Request metrics in Prometheus text format and an opt-in sampling profiler.
+
+``MetricsMiddleware`` is plain ASGI: per request it takes two
+``perf_counter`` readings and updates a few dicts, with no extra tasks and
+no wrapping of the request body. Route labels use the matched route
+template (``/crops/{crop_name}``), so label cardinality stays bounded.
+
+Profiling is enabled with ``AGRIOPTIMA_PROFILING=1``. A request carrying
+``X-Profile: 1`` (or ``?__profile=1``) is then sampled every
+``AGRIOPTIMA_PROFILE_INTERVAL`` seconds, and its response body is replaced
+with collapsed stacks (``frame;frame;frame count`` per line), ready for
+``flamegraph.pl`` or speedscope. Only the event-loop thread is sampled,
+so other requests running at the same time show up in the dump too.
+"""
+import math
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from typing import Callable, Dict, List, Tuple
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self, name: str, labels: str) -> List[str]:
+        sep = "," if labels else ""
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (math.inf,), self.counts):
+            cumulative += count
+            le = "+Inf" if bound == math.inf else repr(bound)
+            lines.append(f'{name}_bucket{{{labels}{sep}le="{le}"}} {cumulative}')
+        lines.append(f"{name}_sum{{{labels}}} {self.sum}")
+        lines.append(f"{name}_count{{{labels}}} {self.count}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class RouteStats:
+    __slots__ = ("statuses", "latency", "request_size", "response_size")
+
+    def __init__(self):
+        self.statuses: Counter = Counter()
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.request_size = Histogram(SIZE_BUCKETS)
+        self.response_size = Histogram(SIZE_BUCKETS)
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.routes: Dict[Tuple[str, str], RouteStats] = {}
+        self.in_flight = 0
+        self.caches: Dict[str, Callable[[], Dict]] = {}
+
+    def register_cache(self, name: str, stats: Callable[[], Dict]) -> None:
+        """``stats`` must return a dict with at least ``hits`` and ``misses``."""
+        self.caches[name] = stats
+
+    def record(self, method: str, route: str, status: int, seconds: float, request_bytes: int, response_bytes: int) -> None:
+        stats = self.routes.get((method, route))
+        if stats is None:
+            stats = self.routes[(method, route)] = RouteStats()
+        stats.statuses[status] += 1
+        stats.latency.observe(seconds)
+        stats.request_size.observe(request_bytes)
+        stats.response_size.observe(response_bytes)
+
+    def render(self) -> str:
+        routes = sorted(self.routes.items())
+        labels = {key: f'method="{key[0]}",route="{_escape(key[1])}"' for key, _ in routes}
+        lines = [
+            "# HELP agrioptima_http_requests_total Requests handled, by route template and status.",
+            "# TYPE agrioptima_http_requests_total counter",
+        ]
+        for key, stats in routes:
+            for status, count in sorted(stats.statuses.items()):
+                lines.append(f'agrioptima_http_requests_total{{{labels[key]},status="{status}"}} {count}')
+
+        for name, attr, help_text in (
+            ("agrioptima_http_request_duration_seconds", "latency", "Time from request start to the last response byte."),
+            ("agrioptima_http_request_size_bytes", "request_size", "Request body size from Content-Length."),
+            ("agrioptima_http_response_size_bytes", "response_size", "Response body bytes sent."),
+        ):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+            for key, stats in routes:
+                lines += getattr(stats, attr).render(name, labels[key])
+
+        lines += [
+            "# HELP agrioptima_http_requests_in_flight Requests currently being handled.",
+            "# TYPE agrioptima_http_requests_in_flight gauge",
+            f"agrioptima_http_requests_in_flight {self.in_flight}",
+        ]
+
+        if self.caches:
+            stats = {name: fetch() for name, fetch in sorted(self.caches.items())}
+            for metric, verb in (("hits", "found"), ("misses", "missed")):
+                lines += [
+                    f"# HELP agrioptima_cache_{metric}_total Cache lookups that {verb} a fresh entry.",
+                    f"# TYPE agrioptima_cache_{metric}_total counter",
+                ]
+                lines += [f'agrioptima_cache_{metric}_total{{cache="{name}"}} {s.get(metric, 0)}' for name, s in stats.items()]
+            lines += [
+                "# HELP agrioptima_cache_hit_ratio Share of lookups served without recomputing.",
+                "# TYPE agrioptima_cache_hit_ratio gauge",
+            ]
+            for name, s in stats.items():
+                lookups = s.get("hits", 0) + s.get("misses", 0) + s.get("coalesced", 0)
+                ratio = (lookups - s.get("misses", 0)) / lookups if lookups else 0.0
+                lines.append(f'agrioptima_cache_hit_ratio{{cache="{name}"}} {ratio}')
+        return "\n".join(lines) + "\n"
+
+
+class StackSampler:
+    """Samples one thread's Python stack on a background thread."""
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="agrioptima-profiler", daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+def _wants_profile(scope) -> bool:
+    if b"__profile=1" in scope.get("query_string", b""):
+        return True
+    return any(name == b"x-profile" and value in (b"1", b"true") for name, value in scope.get("headers", ()))
+
+
+class MetricsMiddleware:
+    def __init__(self, app, registry: MetricsRegistry, profiling: bool = False, profile_interval: float = 0.001):
+        self.app = app
+        self.registry = registry
+        self.profiling = profiling
+        self.profile_interval = profile_interval
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        if self.profiling and _wants_profile(scope):
+            await self._profile(scope, receive, send)
+            return
+
+        registry = self.registry
+        status = 500
+        response_bytes = 0
+
+        async def send_wrapper(message):
+            nonlocal status, response_bytes
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                response_bytes += len(message.get("body", b""))
+            await send(message)
+
+        registry.in_flight += 1
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            registry.in_flight -= 1
+            route = scope.get("route")
+            request_bytes = 0
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    request_bytes = int(value) if value.isdigit() else 0
+                    break
+            registry.record(
+                scope["method"], getattr(route, "path", "unmatched"), status, elapsed, request_bytes, response_bytes
+            )
+
+    async def _profile(self, scope, receive, send):
+        status = 500
+
+        async def discard(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+        started = time.perf_counter()
+        with StackSampler(threading.get_ident(), self.profile_interval) as sampler:
+            await self.app(scope, receive, discard)
+        elapsed = time.perf_counter() - started
+
+        body = sampler.collapsed().encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"text/plain; charset=utf-8"),
+                (b"content-length", str(len(body)).encode()),
+                (b"x-profile-status", str(status).encode()),
+                (b"x-profile-seconds", f"{elapsed:.6f}".encode()),
+                (b"x-profile-samples", str(sum(sampler.stacks.values())).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,312 @@
+"""Declarative crop prediction rules compiled into a decision index.
+
+The rule set (``rules.json``) is an ordered list of ``{"crop", "when"}``
+entries; the first rule whose conditions all hold wins, otherwise the
+``default`` crop is returned. With ``include_requirements`` set, every
+catalog crop also gets a rule requiring each reading to fall inside its
+``requirements`` ranges, appended after the hand-written rules.
+
+``RuleIndex`` compiles the rules per field: the condition bounds split each
+numeric axis into buckets, and every bucket stores a bitset of the rules
+it satisfies. A lookup is one binary search per field plus a few bitset
+ANDs, and the lowest surviving bit is the first matching rule, so the
+cost barely moves as rules are added.
+"""
+import json
+import logging
+import math
+import os
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple
+
+from _catalog import encode_json, requirement_ranges
+
+logger = logging.getLogger(__name__)
+
+NUMERIC_FIELDS = ("temperature", "humidity", "nLevel", "pLevel", "kLevel", "rainfall", "phLevel")
+CATEGORICAL_FIELDS = ("soilType",)
+
+# op -> (is_lower_bound, inclusive)
+NUMERIC_OPS = {"gt": (True, False), "ge": (True, True), "lt": (False, False), "le": (False, True)}
+CATEGORICAL_OPS = ("eq", "in")
+
+WORD_BITS = 64
+
+
+class Interval:
+    """Intersection of the numeric bounds a rule puts on one field."""
+
+    def __init__(self):
+        self.lo, self.lo_inclusive = -math.inf, False
+        self.hi, self.hi_inclusive = math.inf, False
+
+    def add(self, op: str, value: float) -> None:
+        is_lower, inclusive = NUMERIC_OPS[op]
+        if is_lower:
+            if value > self.lo or (value == self.lo and not inclusive):
+                self.lo, self.lo_inclusive = value, inclusive
+        elif value < self.hi or (value == self.hi and not inclusive):
+            self.hi, self.hi_inclusive = value, inclusive
+
+    def bounds(self) -> List[float]:
+        return [b for b in (self.lo, self.hi) if math.isfinite(b)]
+
+    def bucket_range(self, position: Dict[float, int], n_buckets: int) -> Tuple[int, int]:
+        """First and last bucket (see ``RuleIndex``) inside this interval."""
+        first = 0 if self.lo == -math.inf else 2 * position[self.lo] + (1 if self.lo_inclusive else 2)
+        last = n_buckets - 1 if self.hi == math.inf else 2 * position[self.hi] + (1 if self.hi_inclusive else 0)
+        return first, last
+
+
+def compile_condition(field: str, condition: Dict[str, Any]):
+    if field in CATEGORICAL_FIELDS:
+        values = set()
+        for op, value in condition.items():
+            if op == "eq":
+                values.add(value)
+            elif op == "in":
+                values.update(value)
+            else:
+                raise ValueError(f"Unsupported operator {op!r} for {field}")
+        return frozenset(values)
+    if field not in NUMERIC_FIELDS:
+        raise ValueError(f"Unknown field {field!r}")
+    interval = Interval()
+    for op, value in condition.items():
+        if op not in NUMERIC_OPS:
+            raise ValueError(f"Unsupported operator {op!r} for {field}")
+        interval.add(op, float(value))
+    return interval
+
+
+def requirement_rules(crop_details: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "crop": name,
+            "when": {field: {"ge": lo, "le": hi} for field, (lo, hi) in requirement_ranges(details).items()},
+            "source": "requirements",
+        }
+        for name, details in crop_details.items()
+        if details.get("requirements")
+    ]
+
+
+def check_rule(rule: Any) -> None:
+    """Raise ``ValueError`` unless ``rule`` is something ``compile_condition`` accepts."""
+    if not isinstance(rule, dict):
+        raise ValueError(f"Rule must be an object: {rule!r}")
+    if not isinstance(rule.get("crop"), str) or not rule["crop"]:
+        raise ValueError(f"Rule without a crop: {rule!r}")
+    when = rule.get("when", {})
+    if not isinstance(when, dict):
+        raise ValueError(f"'when' of the {rule['crop']} rule must be an object")
+    for field, condition in when.items():
+        if field not in NUMERIC_FIELDS and field not in CATEGORICAL_FIELDS:
+            raise ValueError(f"Unknown field {field!r} in the {rule['crop']} rule")
+        if not isinstance(condition, dict):
+            raise ValueError(f"Condition on {field} in the {rule['crop']} rule must be an object")
+        for op, value in condition.items():
+            if op not in (CATEGORICAL_OPS if field in CATEGORICAL_FIELDS else NUMERIC_OPS):
+                raise ValueError(f"Unsupported operator {op!r} for {field} in the {rule['crop']} rule")
+            if field in CATEGORICAL_FIELDS:
+                values = value if op == "in" else [value]
+                if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+                    raise ValueError(f"{field} {op!r} in the {rule['crop']} rule needs a string or a list of strings")
+            elif isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+                raise ValueError(f"{field} {op!r} in the {rule['crop']} rule needs a finite number")
+
+
+def load_rule_set(path: str, crop_details: Dict[str, Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], str]:
+    with open(path, encoding="utf-8") as f:
+        spec = json.load(f)
+    if not isinstance(spec, dict) or not isinstance(spec.get("rules", []), list):
+        raise ValueError("Rule file must be an object with a 'rules' list")
+    if not isinstance(spec.get("default", "Maize"), str):
+        raise ValueError("'default' must be a crop name")
+    for rule in spec.get("rules", []):
+        check_rule(rule)
+    rules = [dict(rule, source="rules") for rule in spec.get("rules", [])]
+    if spec.get("include_requirements"):
+        rules += requirement_rules(crop_details)
+    return rules, spec.get("default", "Maize")
+
+
+def _mask_words(mask: int, n_words: int) -> List[int]:
+    return [(mask >> (WORD_BITS * w)) & 0xFFFFFFFFFFFFFFFF for w in range(n_words)]
+
+
+class RuleIndex:
+    def __init__(self, rules: List[Dict[str, Any]], default: str):
+        self.rules = rules
+        self.default = default
+        self.crops = [rule["crop"] for rule in rules] + [default]
+        self.encoded_results = [encode_json({"suggested_crop": crop}) for crop in self.crops]
+        self.all_rules = (1 << len(rules)) - 1
+
+        conditions = []
+        for rule in rules:
+            if not rule.get("crop"):
+                raise ValueError(f"Rule without a crop: {rule!r}")
+            conditions.append({field: compile_condition(field, cond) for field, cond in rule.get("when", {}).items()})
+
+        # field -> (sorted breakpoints, per-bucket masks); the last mask is for NaN.
+        # Bucket 2i is the open gap below breakpoints[i], bucket 2i + 1 is
+        # breakpoints[i] itself, and bucket 2m is everything above the last one.
+        self.numeric = {}
+        for field in NUMERIC_FIELDS:
+            constrained = [(bit, cond[field]) for bit, cond in enumerate(conditions) if field in cond]
+            if not constrained:
+                continue
+            unconstrained = self.all_rules
+            for bit, _ in constrained:
+                unconstrained &= ~(1 << bit)
+            breakpoints = sorted({b for _, interval in constrained for b in interval.bounds()})
+            position = {b: i for i, b in enumerate(breakpoints)}
+            n_buckets = 2 * len(breakpoints) + 1
+            # Each rule holds on a contiguous run of buckets; sweep once, adding
+            # its bit where the run starts and dropping it after the run ends.
+            starts = [0] * (n_buckets + 1)
+            ends = [0] * (n_buckets + 1)
+            for bit, interval in constrained:
+                first, last = interval.bucket_range(position, n_buckets)
+                if first <= last:
+                    starts[first] |= 1 << bit
+                    ends[last + 1] |= 1 << bit
+            masks = []
+            running = 0
+            for bucket in range(n_buckets):
+                running = (running & ~ends[bucket]) | starts[bucket]
+                masks.append(unconstrained | running)
+            masks.append(unconstrained)
+            self.numeric[field] = (breakpoints, masks)
+
+        # field -> (value -> mask, mask for any other value)
+        self.categorical = {}
+        for field in CATEGORICAL_FIELDS:
+            constrained = [(bit, cond[field]) for bit, cond in enumerate(conditions) if field in cond]
+            if not constrained:
+                continue
+            unconstrained = self.all_rules
+            for bit, _ in constrained:
+                unconstrained &= ~(1 << bit)
+            by_value = {}
+            for bit, values in constrained:
+                for value in values:
+                    by_value[value] = by_value.get(value, unconstrained) | (1 << bit)
+            self.categorical[field] = (by_value, unconstrained)
+
+        self._arrays = None
+
+    def _first(self, mask: int) -> int:
+        return (mask & -mask).bit_length() - 1 if mask else len(self.rules)
+
+    def predict_index(self, row: Any) -> int:
+        mask = self.all_rules
+        for field, (breakpoints, masks) in self.numeric.items():
+            x = getattr(row, field)
+            if x != x:
+                mask &= masks[-1]
+            else:
+                i = bisect_left(breakpoints, x)
+                mask &= masks[2 * i + 1 if i < len(breakpoints) and breakpoints[i] == x else 2 * i]
+            if not mask:
+                return len(self.rules)
+        for field, (by_value, other) in self.categorical.items():
+            mask &= by_value.get(getattr(row, field), other)
+        return self._first(mask)
+
+    def predict(self, row: Any) -> str:
+        return self.crops[self.predict_index(row)]
+
+    def _numpy_tables(self):
+        import numpy as np
+
+        if self._arrays is None:
+            n_words = max(1, -(-len(self.rules) // WORD_BITS))
+            to_table = lambda masks: np.array([_mask_words(m, n_words) for m in masks], dtype=np.uint64).reshape(-1, n_words)
+            self._arrays = (
+                n_words,
+                {field: (np.asarray(bps, dtype=np.float64), to_table(masks)) for field, (bps, masks) in self.numeric.items()},
+                {field: (by_value, to_table([other]), to_table(list(by_value.values()))) for field, (by_value, other) in self.categorical.items()},
+            )
+        return self._arrays
+
+    def predict_columns(self, columns: Dict[str, List[Any]]):
+        """Index into ``self.crops`` of the first matching rule for every row."""
+        import numpy as np
+
+        n_words, numeric, categorical = self._numpy_tables()
+        n_rows = len(columns[NUMERIC_FIELDS[0]])
+        combined = np.full((n_rows, n_words), np.uint64(0xFFFFFFFFFFFFFFFF), dtype=np.uint64)
+        for field, (breakpoints, table) in numeric.items():
+            x = np.asarray(columns[field], dtype=np.float64)
+            i = np.searchsorted(breakpoints, x, side="left")
+            exact = (i < len(breakpoints)) & (breakpoints[np.minimum(i, len(breakpoints) - 1)] == x) if len(breakpoints) else 0
+            bucket = np.where(np.isnan(x), len(table) - 1, 2 * i + exact)
+            combined &= table[bucket]
+        for field, (by_value, other, table) in categorical.items():
+            values, inverse = np.unique(np.asarray(columns[field], dtype=object), return_inverse=True)
+            positions = {value: pos for pos, value in enumerate(by_value)}
+            rows = np.array([positions.get(value, -1) for value in values.tolist()], dtype=np.intp)[inverse.reshape(-1)]
+            combined &= np.where((rows >= 0)[:, None], table[np.maximum(rows, 0)], other)
+
+        nonzero = combined != 0
+        word = nonzero.argmax(axis=1)
+        lowest = combined[np.arange(n_rows), word]
+        lowest &= ~lowest + np.uint64(1)
+        bit = np.frexp(lowest.astype(np.float64))[1] - 1
+        return np.where(nonzero.any(axis=1), word * WORD_BITS + bit, len(self.rules))
+
+    def crop_names(self, indices) -> List[str]:
+        return [self.crops[i] for i in indices.tolist()]
+
+    def encode_results(self, indices) -> bytes:
+        """Serialize ``[{"suggested_crop": ...}, ...]`` without building the dicts."""
+        return b"[" + b",".join(self.encoded_results[i] for i in indices.tolist()) + b"]"
+
+    def describe(self) -> Dict[str, Any]:
+        return {"default": self.default, "rules": self.rules}
+
+
+class RuleEngine:
+    """Holds the compiled ``RuleIndex`` and swaps it when the rule file changes.
+
+    The rules are first compiled on first use, not at import. After that the
+    file's mtime is checked at most every ``check_interval`` seconds. A rule
+    file that fails to compile is logged and the previous index stays in
+    service.
+    """
+
+    def __init__(self, path: str, crop_details: Dict[str, Dict[str, Any]], check_interval: float = 2.0):
+        self.path = path
+        self.crop_details = crop_details
+        self.check_interval = check_interval
+        self._mtime: Optional[float] = None
+        self._next_check = 0.0
+        self._index: Optional[RuleIndex] = None
+
+    def reload(self) -> RuleIndex:
+        mtime = os.stat(self.path).st_mtime
+        rules, default = load_rule_set(self.path, self.crop_details)
+        self._index = RuleIndex(rules, default)
+        self._mtime = mtime
+        return self._index
+
+    @property
+    def index(self) -> RuleIndex:
+        if self._index is None:
+            self._next_check = time.monotonic() + self.check_interval
+            return self.reload()
+        now = time.monotonic()
+        if now >= self._next_check:
+            self._next_check = now + self.check_interval
+            try:
+                mtime = os.stat(self.path).st_mtime
+                if mtime != self._mtime:
+                    # Recorded up front so a broken file is reported once, not on every check.
+                    self._mtime = mtime
+                    self.reload()
+            except (OSError, ValueError) as exc:
+                logger.warning("Keeping previous prediction rules; reload of %s failed: %s", self.path, exc)
+        return self._index
@@ -0,0 +1,119 @@
+"""Profile storage with optimistic concurrency.
+
+Every stored profile carries a version that increases by one on each write.
+``put`` with ``expected_version`` fails with ``ProfileVersionConflict`` if
+another writer got there first. A user that has never saved a profile
+reads as the default profile at version 0.
+"""
+import json
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from _db import SQLitePool, transaction
+
+if TYPE_CHECKING:
+    import sqlite3
+
+Profile = Dict[str, Any]
+
+
+class ProfileVersionConflict(Exception):
+    def __init__(self, current_version: int):
+        super().__init__(f"Profile was modified; current version is {current_version}")
+        self.current_version = current_version
+
+
+class ProfileStore:
+    async def get(self, user_id: str) -> Tuple[Profile, int]:
+        raise NotImplementedError
+
+    async def put(self, user_id: str, profile: Profile, expected_version: Optional[int] = None) -> int:
+        """Store ``profile`` and return its new version."""
+        raise NotImplementedError
+
+
+class SQLiteProfileStore(ProfileStore):
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS profiles (
+            user_id TEXT PRIMARY KEY,
+            data TEXT NOT NULL,
+            version INTEGER NOT NULL,
+            updated_at REAL NOT NULL
+        );
+    """
+
+    def __init__(self, path: str, default_profile: Profile, pool_size: int = 4):
+        self.pool = SQLitePool(path, self.SCHEMA, pool_size)
+        self.default_profile = default_profile
+
+    def _get(self, conn: "sqlite3.Connection", user_id: str) -> Tuple[Profile, int]:
+        row = conn.execute("SELECT data, version FROM profiles WHERE user_id = ?", (user_id,)).fetchone()
+        if row is None:
+            return dict(self.default_profile), 0
+        return json.loads(row[0]), row[1]
+
+    def _put(self, conn: "sqlite3.Connection", user_id: str, profile: Profile, expected_version: Optional[int]) -> int:
+        row = conn.execute("SELECT version FROM profiles WHERE user_id = ?", (user_id,)).fetchone()
+        current = row[0] if row else 0
+        if expected_version is not None and expected_version != current:
+            raise ProfileVersionConflict(current)
+        conn.execute(
+            "INSERT INTO profiles (user_id, data, version, updated_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(user_id) DO UPDATE SET data = excluded.data, version = excluded.version, "
+            "updated_at = excluded.updated_at",
+            (user_id, json.dumps(profile, ensure_ascii=False), current + 1, time.time()),
+        )
+        return current + 1
+
+    async def get(self, user_id: str) -> Tuple[Profile, int]:
+        return await self.pool.run(self._get, user_id)
+
+    async def put(self, user_id: str, profile: Profile, expected_version: Optional[int] = None) -> int:
+        return await self.pool.run(transaction, self._put, user_id, profile, expected_version)
+
+
+class CachedProfileStore(ProfileStore):
+    """Read-through cache in front of another store.
+
+    Writes go to the backing store first, so the version check there stays
+    authoritative. Reads may trail writes made by other worker processes
+    by up to ``ttl`` seconds.
+    """
+
+    def __init__(self, store: ProfileStore, ttl: float = 1.0, maxsize: int = 10000):
+        self.store = store
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: Dict[str, Tuple[float, Profile, int]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _remember(self, user_id: str, profile: Profile, version: int) -> None:
+        current = self._entries.get(user_id)
+        if current is not None and current[2] > version:
+            return  # a newer write finished first
+        if len(self._entries) >= self.maxsize and user_id not in self._entries:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[user_id] = (time.monotonic() + self.ttl, profile, version)
+
+    async def get(self, user_id: str) -> Tuple[Profile, int]:
+        entry = self._entries.get(user_id)
+        if entry is not None and entry[0] > time.monotonic():
+            self.hits += 1
+            return dict(entry[1]), entry[2]
+        self.misses += 1
+        profile, version = await self.store.get(user_id)
+        self._remember(user_id, profile, version)
+        return dict(profile), version
+
+    async def put(self, user_id: str, profile: Profile, expected_version: Optional[int] = None) -> int:
+        try:
+            version = await self.store.put(user_id, profile, expected_version)
+        except ProfileVersionConflict:
+            self._entries.pop(user_id, None)
+            raise
+        self._remember(user_id, dict(profile), version)
+        return version
+
+    def stats(self) -> Dict[str, Any]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "ttl": self.ttl}
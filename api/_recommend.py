@@ -0,0 +1,81 @@
+"""Top-k crop ranking against the catalog's ``requirements`` ranges.
+
+Each crop is a box in (temperature, rainfall, phLevel, nLevel, pLevel,
+kLevel) space. A reading's distance to a crop is the Euclidean distance to
+that box, with every axis divided by the median range width so that pH and
+rainfall weigh comparably. Suitability is ``1 / (1 + distance)``: 1.0 means
+every reading is inside the crop's ranges. A NaN reading is treated as
+unknown and counts against no crop; an infinite one scores 0.0 wherever
+that axis is bounded.
+"""
+import math
+from typing import Any, Dict, List
+
+from _catalog import REQUIREMENT_FIELDS, requirement_ranges
+
+FEATURES = tuple(REQUIREMENT_FIELDS.values())
+
+# Bound the (rows, crops, features) intermediate to roughly 32 MB per chunk.
+MAX_CHUNK_CELLS = 4_000_000
+
+
+class CropRecommender:
+    def __init__(self, crop_details: Dict[str, Dict[str, Any]]):
+        self.crop_details = crop_details
+        self.crops: List[str] = []
+        self._arrays = None
+
+    def _matrices(self):
+        import numpy as np
+
+        if self._arrays is None:
+            ranges_by_crop = []
+            for name, details in self.crop_details.items():
+                ranges = requirement_ranges(details)
+                if ranges:
+                    self.crops.append(name)
+                    ranges_by_crop.append([ranges.get(f, (-math.inf, math.inf)) for f in FEATURES])
+            bounds = np.asarray(ranges_by_crop, dtype=np.float64).reshape(len(self.crops), len(FEATURES), 2)
+            lo, hi = bounds[:, :, 0], bounds[:, :, 1]
+            widths = np.where(np.isfinite(hi - lo), hi - lo, np.nan)
+            scale = np.nanmedian(widths, axis=0) if len(self.crops) else np.ones(len(FEATURES))
+            scale = np.where(np.isfinite(scale) & (scale > 0), scale, 1.0)
+            self._arrays = (lo / scale, hi / scale, scale)
+        return self._arrays
+
+    def scores(self, features):
+        """Suitability of every crop for every row of a ``(rows, len(FEATURES))`` array."""
+        import numpy as np
+
+        lo, hi, scale = self._matrices()
+        x = (features / scale)[:, None, :]
+        # fmax skips NaN, so an unknown reading (or inf - inf) leaves a gap of 0.
+        gap = np.fmax(np.fmax(lo - x, x - hi), 0.0)
+        return 1.0 / (1.0 + np.sqrt(np.einsum("rcf,rcf->rc", gap, gap)))
+
+    def top_k(self, columns: Dict[str, List[Any]], k: int) -> List[List[Dict[str, Any]]]:
+        import numpy as np
+
+        features = np.column_stack([np.asarray(columns[f], dtype=np.float64) for f in FEATURES])
+        self._matrices()
+        k = min(k, len(self.crops))
+        if k <= 0:
+            return [[] for _ in range(len(features))]
+        chunk = max(1, MAX_CHUNK_CELLS // max(1, len(self.crops) * len(FEATURES)))
+        results = []
+        for start in range(0, len(features), chunk):
+            scores = self.scores(features[start:start + chunk])
+            if k < len(self.crops):
+                candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            else:
+                candidates = np.broadcast_to(np.arange(len(self.crops)), scores.shape)
+            picked = np.take_along_axis(scores, candidates, axis=1)
+            # Highest score first; ties keep catalog order.
+            order = np.lexsort((candidates, -picked), axis=1)
+            candidates = np.take_along_axis(candidates, order, axis=1)
+            picked = np.take_along_axis(picked, order, axis=1)
+            for row_crops, row_scores in zip(candidates.tolist(), picked.tolist()):
+                results.append([
+                    {"crop": self.crops[c], "score": round(s, 4)} for c, s in zip(row_crops, row_scores)
+                ])
+        return results
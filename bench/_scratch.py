@@ -0,0 +1,20 @@
+"""Throwaway SQLite database for benchmark runs.
+
+``/predict``, ``/advise`` and ``PUT /profile`` write to the database named by
+``AGRIOPTIMA_DB_PATH``. Benchmarks point it at a temporary directory that is
+removed on exit, so they never add fake events to, or overwrite profiles in,
+the database a local dev server uses.
+"""
+import atexit
+import os
+import shutil
+import tempfile
+
+
+def use_scratch_db() -> str:
+    """Set ``AGRIOPTIMA_DB_PATH`` for this process and its children; call before importing ``index``."""
+    directory = tempfile.mkdtemp(prefix="agrioptima-bench-")
+    atexit.register(shutil.rmtree, directory, ignore_errors=True)
+    path = os.path.join(directory, "bench.sqlite3")
+    os.environ["AGRIOPTIMA_DB_PATH"] = path
+    return path
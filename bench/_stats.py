@@ -0,0 +1,90 @@
+"""Latency summaries and JSON baselines shared by the benchmark scripts."""
+import json
+import os
+import platform
+import time
+from typing import Dict, List, Optional
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+
+# Metrics where a larger value is a regression; requests_per_s is the opposite.
+LOWER_IS_BETTER = ("p50_ms", "p95_ms", "p99_ms", "alloc_kib_per_req", "import_ms", "app_import_ms", "first_request_ms")
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * pct / 100
+    lo = int(rank)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (rank - lo)
+
+
+def summarize(latencies: List[float], elapsed: float, errors: int = 0) -> Dict[str, float]:
+    """``latencies`` and ``elapsed`` are in seconds."""
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "requests_per_s": round(len(ordered) / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 4) if ordered else 0.0,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 4),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 4),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 4),
+    }
+
+
+def print_table(results: Dict[str, Dict[str, float]]) -> None:
+    columns = ["requests_per_s", "p50_ms", "p95_ms", "p99_ms", "alloc_kib_per_req", "errors"]
+    width = max([len(name) for name in results] + [5])
+    print(f"{'route':<{width}}  " + "  ".join(f"{c:>17}" for c in columns))
+    for name, stats in results.items():
+        cells = [f"{stats[c]:>17,}" if c in stats else f"{'-':>17}" for c in columns]
+        print(f"{name:<{width}}  " + "  ".join(cells))
+
+
+def baseline_path(name: str) -> str:
+    return name if name.endswith(".json") else os.path.join(BASELINE_DIR, f"{name}.json")
+
+
+def save_baseline(name: str, kind: str, results: Dict[str, Dict[str, float]], settings: Dict) -> str:
+    path = baseline_path(name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "kind": kind,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "machine": platform.platform(),
+            "settings": settings,
+            "results": results,
+        }, f, indent=2)
+        f.write("\n")
+    return path
+
+
+def compare(name: str, results: Dict[str, Dict[str, float]], threshold: float) -> List[str]:
+    """Print the change against a saved baseline and return the regressions.
+
+    A metric regresses when it is worse than the baseline by more than
+    ``threshold`` (a fraction, e.g. 0.1 for 10%).
+    """
+    with open(baseline_path(name), encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    regressions = []
+    for route, stats in results.items():
+        old: Optional[Dict[str, float]] = baseline.get(route)
+        if old is None:
+            print(f"{route}: not in baseline")
+            continue
+        changes = []
+        for metric in LOWER_IS_BETTER + ("requests_per_s",):
+            if metric not in stats or not old.get(metric):
+                continue
+            delta = (stats[metric] - old[metric]) / old[metric]
+            worse = delta > threshold if metric in LOWER_IS_BETTER else -delta > threshold
+            changes.append(f"{metric} {delta:+.1%}{' !' if worse else ''}")
+            if worse:
+                regressions.append(f"{route} {metric}: {old[metric]} -> {stats[metric]}")
+        print(f"{route}: " + ", ".join(changes))
+    return regressions
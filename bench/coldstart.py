@@ -0,0 +1,127 @@
+"""Cold-start cost of the serverless entry point.
+
+Each run starts a fresh interpreter with bytecode caching disabled,
+because a serverless instance cannot rely on ``__pycache__``. The child
+then reports:
+
+* ``import_ms``: time to ``import index``, split into ``framework_import_ms``
+  (FastAPI and pydantic, which we cannot shrink) and ``app_import_ms``
+  (everything ``index`` adds on top)
+* ``first_request_ms``: the first request to ``--route``, sent straight to
+  the ASGI app
+* ``second_request_ms``: the same request again, for comparison
+
+The report gives the median and the worst run, and can be saved and
+compared like the other benchmark baselines.
+
+    python bench/coldstart.py --runs 10
+    python bench/coldstart.py --save coldstart
+    python bench/coldstart.py --compare coldstart
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from _scratch import use_scratch_db
+from _stats import compare, save_baseline
+from routes import ROUTES
+
+API_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "api")
+
+CHILD = r"""
+import asyncio, json, sys, time
+started = time.perf_counter()
+import fastapi, fastapi.middleware.cors, pydantic
+framework = time.perf_counter()
+import index
+imported = time.perf_counter()
+
+method, path, body = json.loads(sys.argv[1])
+raw = json.dumps(body).encode() if body is not None else b""
+path, _, query = path.partition("?")
+
+async def request():
+    sent = []
+    async def receive():
+        return {"type": "http.request", "body": raw, "more_body": False}
+    async def send(message):
+        sent.append(message)
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": method,
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": query.encode(),
+        "root_path": "", "headers": [(b"host", b"localhost"), (b"content-type", b"application/json"),
+        (b"content-length", str(len(raw)).encode())], "client": ("127.0.0.1", 1), "server": ("127.0.0.1", 80),
+    }
+    t0 = time.perf_counter()
+    await index.app(scope, receive, send)
+    return time.perf_counter() - t0, sent[0]["status"]
+
+async def main():
+    first, status = await request()
+    second, _ = await request()
+    print(json.dumps({
+        "import_ms": (imported - started) * 1000,
+        "framework_import_ms": (framework - started) * 1000,
+        "app_import_ms": (imported - framework) * 1000,
+        "first_request_ms": first * 1000,
+        "second_request_ms": second * 1000,
+        "status": status,
+    }))
+
+asyncio.run(main())
+"""
+
+METRICS = ("import_ms", "framework_import_ms", "app_import_ms", "first_request_ms", "second_request_ms")
+
+
+def run_once(route):
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    output = subprocess.run(
+        [sys.executable, "-B", "-c", CHILD, json.dumps(ROUTES[route])],
+        cwd=API_DIR, env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--routes", nargs="*", default=["predict", "crops"], choices=list(ROUTES))
+    parser.add_argument("--save", metavar="NAME", help="save results as bench/baselines/NAME.json (or a .json path)")
+    parser.add_argument("--compare", metavar="NAME", help="compare against a saved baseline")
+    parser.add_argument("--threshold", type=float, default=0.10, help="regression threshold as a fraction")
+    args = parser.parse_args()
+
+    use_scratch_db()  # inherited by every child
+    results = {}
+    for route in args.routes:
+        samples = [run_once(route) for _ in range(args.runs)]
+        if any(sample["status"] >= 400 for sample in samples):
+            print(f"{route}: request failed with status {samples[0]['status']}")
+            sys.exit(1)
+        stats = {}
+        for metric in METRICS:
+            values = [sample[metric] for sample in samples]
+            stats[metric] = round(statistics.median(values), 3)
+            stats[metric.replace("_ms", "_max_ms")] = round(max(values), 3)
+        results[f"coldstart_{route}"] = stats
+        print(
+            f"{route:<16} import {stats['import_ms']:8.1f} ms (app {stats['app_import_ms']:.1f})"
+            f"   first request {stats['first_request_ms']:8.1f} ms (max {stats['first_request_max_ms']:.1f})"
+            f"   second request {stats['second_request_ms']:6.2f} ms"
+        )
+
+    if args.save:
+        print("saved", save_baseline(args.save, "coldstart", results, {"runs": args.runs}))
+    if args.compare:
+        regressions = compare(args.compare, results, args.threshold)
+        if regressions:
+            print("\nregressions:\n  " + "\n  ".join(regressions))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
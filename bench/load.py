@@ -0,0 +1,130 @@
+"""HTTP load driver against a local uvicorn serving ``api/index.py``.
+
+Starts uvicorn on a free localhost port (or targets ``--url``), then for
+every route keeps ``--concurrency`` requests in flight for ``--duration``
+seconds and reports throughput and latency percentiles. Runs entirely
+offline; the spawned server writes to a throwaway database (see
+``_scratch.py``).
+
+    python bench/load.py --duration 5 --concurrency 32
+    python bench/load.py --save load --workers 2
+    python bench/load.py --compare load
+"""
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+
+from _scratch import use_scratch_db
+from _stats import compare, print_table, save_baseline, summarize
+from routes import ROUTES
+
+API_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "api")
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port, workers):
+    command = [
+        sys.executable, "-m", "uvicorn", "index:app", "--app-dir", API_DIR,
+        "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning", "--no-access-log",
+        "--workers", str(workers),
+    ]
+    server = subprocess.Popen(command)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with code {server.returncode}")
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/crops/Rice", timeout=1).raise_for_status()
+            return server
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    server.terminate()
+    raise RuntimeError("uvicorn did not become ready within 30 s")
+
+
+async def drive(client, method, path, body, concurrency, duration, warmup):
+    latencies = []
+    errors = 0
+
+    async def worker(until, record):
+        nonlocal errors
+        while time.monotonic() < until:
+            t0 = time.perf_counter()
+            try:
+                response = await client.request(method, path, json=body)
+                ok = response.status_code < 400
+            except httpx.HTTPError:
+                ok = False
+            if record:
+                if ok:
+                    latencies.append(time.perf_counter() - t0)
+                else:
+                    errors += 1
+
+    await asyncio.gather(*(worker(time.monotonic() + warmup, False) for _ in range(concurrency)))
+    started = time.monotonic()
+    await asyncio.gather(*(worker(started + duration, True) for _ in range(concurrency)))
+    return summarize(latencies, time.monotonic() - started, errors)
+
+
+async def run(base_url, names, concurrency, duration, warmup):
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        results = {}
+        for name in names:
+            method, path, body = ROUTES[name]
+            results[name] = await drive(client, method, path, body, concurrency, duration, warmup)
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--routes", nargs="*", default=list(ROUTES), choices=list(ROUTES))
+    parser.add_argument("--url", help="target an already running server instead of starting one")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=5.0, help="measured seconds per route")
+    parser.add_argument("--warmup", type=float, default=1.0, help="unmeasured seconds per route")
+    parser.add_argument("--save", metavar="NAME", help="save results as bench/baselines/NAME.json (or a .json path)")
+    parser.add_argument("--compare", metavar="NAME", help="compare against a saved baseline")
+    parser.add_argument("--threshold", type=float, default=0.10, help="regression threshold as a fraction")
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.url
+    if not base_url:
+        use_scratch_db()  # inherited by uvicorn
+        port = free_port()
+        server = start_server(port, args.workers)
+        base_url = f"http://127.0.0.1:{port}"
+    try:
+        results = asyncio.run(run(base_url, args.routes, args.concurrency, args.duration, args.warmup))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+
+    print_table(results)
+    settings = {"concurrency": args.concurrency, "duration": args.duration, "workers": args.workers, "url": args.url}
+    if args.save:
+        print("saved", save_baseline(args.save, "load", results, settings))
+    if args.compare:
+        regressions = compare(args.compare, results, args.threshold)
+        if regressions:
+            print("\nregressions:\n  " + "\n  ".join(regressions))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
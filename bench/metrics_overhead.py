@@ -0,0 +1,72 @@
+"""Per-request cost of ``MetricsMiddleware`` on the hot path.
+
+Drives a minimal ASGI app directly, with and without the middleware, and
+reports the difference in nanoseconds per request. Nothing else is in
+the path, so the delta is the instrumentation itself.
+
+    python bench/metrics_overhead.py --iterations 200000
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "api"))
+
+from _metrics import MetricsMiddleware, MetricsRegistry
+
+
+class Route:
+    path = "/crops/{crop_name}"
+
+
+ROUTE = Route()
+BODY = b'{"suggested_crop":"Rice"}'
+
+
+async def endpoint(scope, receive, send):
+    scope["route"] = ROUTE
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-length", b"25")]})
+    await send({"type": "http.response.body", "body": BODY})
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message):
+    pass
+
+
+async def per_request_ns(app, iterations):
+    headers = [(b"host", b"localhost"), (b"accept", b"application/json"), (b"content-length", b"0")]
+    started = time.perf_counter_ns()
+    for _ in range(iterations):
+        await app({"type": "http", "method": "GET", "path": "/crops/Rice", "query_string": b"", "headers": headers}, receive, send)
+    return (time.perf_counter_ns() - started) / iterations
+
+
+async def run(iterations, rounds):
+    wrapped = MetricsMiddleware(endpoint, MetricsRegistry())
+    bare, instrumented = [], []
+    for _ in range(rounds):
+        bare.append(await per_request_ns(endpoint, iterations))
+        instrumented.append(await per_request_ns(wrapped, iterations))
+    return min(bare), min(instrumented)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=100000)
+    parser.add_argument("--rounds", type=int, default=5, help="best of N rounds")
+    args = parser.parse_args()
+
+    bare, instrumented = asyncio.run(run(args.iterations, args.rounds))
+    print(f"bare endpoint        {bare:8.0f} ns/request")
+    print(f"with metrics         {instrumented:8.0f} ns/request")
+    print(f"overhead             {instrumented - bare:8.0f} ns/request")
+
+
+if __name__ == "__main__":
+    main()
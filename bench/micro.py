@@ -0,0 +1,136 @@
+"""In-process micro-benchmarks of the ``api/index.py`` route handlers.
+
+Each case validates its input, awaits the handler and serializes the result
+the way FastAPI would, without HTTP or ASGI routing in between. Latency is
+timed with ``perf_counter_ns`` and allocations are measured with a separate
+``tracemalloc`` pass, so tracing does not skew the timings. Writes go to a
+throwaway database (see ``_scratch.py``).
+
+    python bench/micro.py                      # print results
+    python bench/micro.py --save micro         # write bench/baselines/micro.json
+    python bench/micro.py --compare micro      # diff against that baseline
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "api"))
+
+from _scratch import use_scratch_db
+
+use_scratch_db()
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+from starlette.requests import Request
+
+import index
+from _stats import compare, print_table, save_baseline, summarize
+from routes import ROUTES
+
+
+def make_request(method, path, body=None, headers=None):
+    path, _, query = path.partition("?")
+    raw = json.dumps(body).encode() if body is not None else b""
+    header_list = [(b"content-type", b"application/json")] + [
+        (k.lower().encode(), v.encode()) for k, v in (headers or {}).items()
+    ]
+
+    async def receive():
+        return {"type": "http.request", "body": raw, "more_body": False}
+
+    scope = {
+        "type": "http", "method": method, "path": path, "query_string": query.encode(),
+        "headers": header_list, "client": ("127.0.0.1", 0), "server": ("127.0.0.1", 8000),
+        "scheme": "http", "root_path": "", "app": index.app,
+    }
+    return Request(scope, receive)
+
+
+def handler_calls():
+    """name -> zero-argument coroutine factory calling the route's handler."""
+    return {
+        "predict": lambda: index.predict_crop(index.PredictionInput(**ROUTES["predict"][2])),
+        "predict_batch_1k": lambda: index.predict_crop_batch(make_request(*ROUTES["predict_batch_1k"])),
+        "advise": lambda: index.advise(index.PredictionInput(**ROUTES["advise"][2])),
+        "advise_batch_1k": lambda: index.advise_batch(make_request(*ROUTES["advise_batch_1k"])),
+        "recommend": lambda: index.recommend_crops(index.PredictionInput(**ROUTES["recommend"][2]), k=5),
+        "recommend_batch_1k": lambda: index.recommend_crops_batch(make_request(*ROUTES["recommend_batch_1k"]), k=5),
+        "market_insights": lambda: index.get_market_insights("Rice", "Pune"),
+        "crops": lambda: index.get_all_crops(make_request("GET", "/crops")),
+        "crop_details": lambda: index.get_crop_details("Rice", make_request("GET", "/crops/Rice")),
+        "analytics": lambda: index.get_analytics(start=None, end=None, location=None),
+        "profile_get": lambda: index.get_profile(Response(), x_user_id=None, if_none_match=None),
+        "profile_put": lambda: index.update_profile(
+            index.ProfileUpdate(**ROUTES["profile_put"][2]), Response(), x_user_id=None, if_match=None
+        ),
+        "rules": lambda: index.get_rules(),
+        "metrics": lambda: index.get_metrics(),
+    }
+
+
+def serialize(result):
+    if hasattr(result, "body"):
+        return result.body
+    return JSONResponse(jsonable_encoder(result)).body
+
+
+async def run_case(call, iterations, warmup):
+    for _ in range(warmup):
+        serialize(await call())
+
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        t0 = time.perf_counter_ns()
+        serialize(await call())
+        latencies.append((time.perf_counter_ns() - t0) / 1e9)
+    stats = summarize(latencies, time.perf_counter() - started)
+
+    alloc_iterations = max(1, iterations // 10)
+    tracemalloc.start()
+    try:
+        allocated = 0
+        for _ in range(alloc_iterations):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            serialize(await call())
+            allocated += tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+    stats["alloc_kib_per_req"] = round(allocated / alloc_iterations / 1024, 2)
+    return stats
+
+
+async def run(names, iterations, warmup):
+    calls = handler_calls()
+    return {name: await run_case(calls[name], iterations, warmup) for name in names}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--routes", nargs="*", default=list(ROUTES), choices=list(ROUTES))
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=200)
+    parser.add_argument("--save", metavar="NAME", help="save results as bench/baselines/NAME.json (or a .json path)")
+    parser.add_argument("--compare", metavar="NAME", help="compare against a saved baseline")
+    parser.add_argument("--threshold", type=float, default=0.10, help="regression threshold as a fraction")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.routes, args.iterations, args.warmup))
+    print_table(results)
+    if args.save:
+        print("saved", save_baseline(args.save, "micro", results, {"iterations": args.iterations, "warmup": args.warmup}))
+    if args.compare:
+        regressions = compare(args.compare, results, args.threshold)
+        if regressions:
+            print("\nregressions:\n  " + "\n  ".join(regressions))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Parity check and throughput benchmark for ``POST /predict/batch``.
+
+Generates random sensor readings, checks that the batch endpoint returns
+exactly what ``/predict`` returns row by row, then reports rows/s for the
+single-row path and the batch path. The predictions are recorded in a
+throwaway database (see ``_scratch.py``).
+
+    python bench/predict_batch.py --rows 20000
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "api"))
+
+from _scratch import use_scratch_db
+
+use_scratch_db()
+
+from fastapi.testclient import TestClient
+
+from index import app, PredictionInput, predict_crop
+
+SOIL_TYPES = ["Clay", "Loam", "Silt", "Sandy", "Red", "Peat"]
+
+
+def random_rows(count, seed):
+    rng = random.Random(seed)
+    return [
+        {
+            "temperature": round(rng.uniform(0, 45), 1),
+            "humidity": round(rng.uniform(10, 100), 1),
+            # Mix in exact thresholds so strict/non-strict comparisons are exercised.
+            "nLevel": rng.choice([round(rng.uniform(0, 200), 1), float(rng.choice([30, 40, 60, 80, 100, 150]))]),
+            "pLevel": round(rng.uniform(0, 120), 1),
+            "kLevel": round(rng.uniform(0, 150), 1),
+            "soilType": rng.choice(SOIL_TYPES),
+            "rainfall": round(rng.uniform(100, 3000), 0),
+            "phLevel": round(rng.uniform(4, 9), 2),
+            "location": None,
+        }
+        for _ in range(count)
+    ]
+
+
+def to_columns(rows):
+    return {field: [row[field] for row in rows] for field in rows[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--single-rows", type=int, default=2000, help="rows sent through the single-row HTTP path")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    client = TestClient(app)
+    rows = random_rows(args.rows, args.seed)
+
+    started = time.perf_counter()
+    response = client.post("/predict/batch", json=to_columns(rows))
+    batch_seconds = time.perf_counter() - started
+    response.raise_for_status()
+    batch_results = response.json()
+
+    ndjson = "\n".join(json.dumps(row) for row in rows)
+    ndjson_results = client.post("/predict/batch", content=ndjson, headers={"content-type": "application/x-ndjson"}).json()
+
+    expected = [asyncio.run(predict_crop(PredictionInput(**row))) for row in rows]
+    mismatches = [i for i, (want, got, nd) in enumerate(zip(expected, batch_results, ndjson_results)) if not want == got == nd]
+    if len(batch_results) != len(rows) or mismatches:
+        print(f"PARITY FAILED: {len(mismatches)} mismatching rows, first: {mismatches[:5]}")
+        sys.exit(1)
+    print(f"parity: {len(rows)} rows identical to /predict (columnar and NDJSON)")
+
+    single = rows[:args.single_rows]
+    started = time.perf_counter()
+    for row in single:
+        client.post("/predict", json=row).raise_for_status()
+    single_seconds = time.perf_counter() - started
+
+    single_rate = len(single) / single_seconds
+    batch_rate = len(rows) / batch_seconds
+    print(f"/predict        {single_rate:12,.0f} rows/s  ({len(single)} requests)")
+    print(f"/predict/batch  {batch_rate:12,.0f} rows/s  (1 request, {len(rows)} rows)")
+    print(f"speedup         {batch_rate / single_rate:12,.1f}x")
+
+
+if __name__ == "__main__":
+    main()
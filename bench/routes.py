@@ -0,0 +1,48 @@
+"""Requests exercised by the benchmark suite, one per ``api/index.py`` route.
+
+``/rules/reload``, ``/market-insights/cache`` and ``/debug`` are left out:
+they are admin and diagnostic endpoints, not request paths worth tracking.
+"""
+
+SAMPLE_INPUT = {
+    "temperature": 27.5,
+    "humidity": 72.0,
+    "nLevel": 75.0,
+    "pLevel": 35.0,
+    "kLevel": 38.0,
+    "soilType": "Clay",
+    "rainfall": 1350.0,
+    "phLevel": 6.2,
+    "location": "Pune",
+}
+
+SAMPLE_PROFILE = {
+    "firstName": "Saloni",
+    "lastName": "Patil",
+    "email": "saloni@agrioptima.com",
+    "mobile": "+91 98765 43210",
+    "city": "Pune",
+    "state": "Maharashtra",
+    "country": "India",
+}
+
+BATCH_ROWS = 1000
+SAMPLE_BATCH = {field: [value] * BATCH_ROWS for field, value in SAMPLE_INPUT.items()}
+
+# name -> (method, path, JSON body)
+ROUTES = {
+    "predict": ("POST", "/predict", SAMPLE_INPUT),
+    "predict_batch_1k": ("POST", "/predict/batch", SAMPLE_BATCH),
+    "advise": ("POST", "/advise", SAMPLE_INPUT),
+    "advise_batch_1k": ("POST", "/advise/batch", SAMPLE_BATCH),
+    "recommend": ("POST", "/recommend?k=5", SAMPLE_INPUT),
+    "recommend_batch_1k": ("POST", "/recommend/batch?k=5", SAMPLE_BATCH),
+    "market_insights": ("GET", "/market-insights?crop_name=Rice&location=Pune", None),
+    "crops": ("GET", "/crops", None),
+    "crop_details": ("GET", "/crops/Rice", None),
+    "analytics": ("GET", "/analytics", None),
+    "profile_get": ("GET", "/profile", None),
+    "profile_put": ("PUT", "/profile", SAMPLE_PROFILE),
+    "rules": ("GET", "/rules", None),
+    "metrics": ("GET", "/metrics", None),
+}
@@ -0,0 +1,20 @@
+"""Regenerate api/crops.json from api/_crop_data.py.
+
+The API loads the crop catalog from this compact JSON artifact instead of
+compiling the large Python literal on every cold start. Run this after
+editing ``_crop_data.py``; until then the API notices the stale artifact
+and falls back to importing the source.
+
+    python scripts/build_crop_catalog.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "api"))
+
+from _catalog import build_crop_artifact
+
+
+if __name__ == "__main__":
+    path = build_crop_artifact()
+    print(f"wrote {os.path.relpath(path)} ({os.path.getsize(path):,} bytes)")
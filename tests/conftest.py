@@ -0,0 +1,41 @@
+"""Shared setup: import path for ``api/`` and a throwaway database.
+
+``index`` opens its SQLite file at import, so ``AGRIOPTIMA_DB_PATH`` is set
+here, before any test module imports it.
+"""
+import atexit
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+
+API_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "api")
+sys.path.insert(0, API_DIR)
+
+_db_dir = tempfile.mkdtemp(prefix="agrioptima-tests-")
+atexit.register(shutil.rmtree, _db_dir, ignore_errors=True)
+os.environ["AGRIOPTIMA_DB_PATH"] = os.path.join(_db_dir, "test.sqlite3")
+
+SAMPLE_INPUT = {
+    "temperature": 27.5,
+    "humidity": 72.0,
+    "nLevel": 75.0,
+    "pLevel": 35.0,
+    "kLevel": 38.0,
+    "soilType": "Clay",
+    "rainfall": 1350.0,
+    "phLevel": 6.2,
+    "location": "Pune",
+}
+
+
+@pytest.fixture(scope="session")
+def client():
+    from fastapi.testclient import TestClient
+
+    import index
+
+    with TestClient(index.app) as client:
+        yield client
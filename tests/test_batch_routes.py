@@ -0,0 +1,97 @@
+"""HTTP parsing of batch bodies shared by the ``/.../batch`` routes."""
+import asyncio
+import json
+
+import pytest
+
+import index
+from _insights import InsightProvider
+from conftest import SAMPLE_INPUT
+
+BATCH_ROUTES = ["/predict/batch", "/advise/batch", "/recommend/batch"]
+NDJSON = {"content-type": "application/x-ndjson"}
+
+
+def ndjson(rows):
+    return "\n".join(json.dumps(row) for row in rows)
+
+
+@pytest.mark.parametrize("path", BATCH_ROUTES)
+def test_columnar_and_ndjson_bodies_agree(client, path):
+    rows = [SAMPLE_INPUT, dict(SAMPLE_INPUT, temperature=12.0, soilType="Loam")]
+    columnar = client.post(path, json={field: [row[field] for row in rows] for field in SAMPLE_INPUT})
+    lines = client.post(path, content=ndjson(rows), headers=NDJSON)
+    assert columnar.status_code == lines.status_code == 200
+    assert columnar.json() == lines.json()
+    assert len(columnar.json()) == 2
+
+
+def test_batch_matches_single_predict_bytes(client):
+    single = client.post("/predict", json=SAMPLE_INPUT).content
+    batch = client.post("/predict/batch", content=ndjson([SAMPLE_INPUT]), headers=NDJSON).content
+    assert batch == b"[" + single + b"]"
+
+
+@pytest.mark.parametrize("path", BATCH_ROUTES)
+@pytest.mark.parametrize("line", ["null", "[1]", '"x"', "3"])
+def test_ndjson_line_that_is_not_an_object_is_422(client, path, line):
+    body = ndjson([SAMPLE_INPUT]) + "\n" + line
+    response = client.post(path, content=body, headers=NDJSON)
+    assert response.status_code == 422
+    assert "Line 2" in response.json()["detail"]
+
+
+@pytest.mark.parametrize("path", BATCH_ROUTES)
+@pytest.mark.parametrize("headers", [NDJSON, {"content-type": "application/json"}])
+@pytest.mark.parametrize("body", [b"\xff\xfe", b"{not json", b'{"temperature": [1'])
+def test_undecodable_body_is_400(client, path, headers, body):
+    assert client.post(path, content=body, headers=headers).status_code == 400
+
+
+@pytest.mark.parametrize("path", BATCH_ROUTES)
+def test_invalid_columns_are_422(client, path):
+    assert client.post(path, json=[SAMPLE_INPUT]).status_code == 422
+    assert client.post(path, json={"temperature": [1.0]}).status_code == 422
+    columns = {field: [value] for field, value in SAMPLE_INPUT.items()}
+    columns["rainfall"] = [1.0, 2.0]
+    assert client.post(path, json=columns).status_code == 422
+    bad_row = dict(SAMPLE_INPUT, temperature="warm")
+    assert client.post(path, content=ndjson([bad_row]), headers=NDJSON).status_code == 422
+
+
+def test_advise_batch_uses_each_ndjson_rows_location(client):
+    rows = [dict(SAMPLE_INPUT, location="Nashik"), dict(SAMPLE_INPUT, location="Nagpur"), dict(SAMPLE_INPUT, location=None)]
+    response = client.post("/advise/batch", content=ndjson(rows), headers=NDJSON)
+    assert response.status_code == 200
+    weather = [row["insights"]["weather"] for row in response.json()]
+    assert weather[0].startswith("Forecast for Nashik:")
+    assert weather[1].startswith("Forecast for Nagpur:")
+    assert weather[2].startswith("Forecast for Current Area:")
+
+
+def test_advise_batch_bounds_concurrent_provider_calls(client, monkeypatch):
+    class CountingProvider(InsightProvider):
+        def __init__(self):
+            self.active = self.peak = self.calls = 0
+
+        async def get_insights(self, crop_name, location):
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0.001)
+            self.active -= 1
+            return {"weather": f"Forecast for {location}", "profit": "", "risk": "Low"}
+
+    provider = CountingProvider()
+    previous = index.insight_provider
+    monkeypatch.setattr(index, "ADVISE_BATCH_CONCURRENCY", 3)
+    index.set_insight_provider(provider)
+    try:
+        rows = [dict(SAMPLE_INPUT, location=f"Village {i}") for i in range(40)]
+        response = client.post("/advise/batch", content=ndjson(rows), headers=NDJSON)
+    finally:
+        index.set_insight_provider(previous)
+    assert response.status_code == 200
+    assert [row["insights"]["weather"] for row in response.json()] == [f"Forecast for Village {i}" for i in range(40)]
+    assert provider.calls == 40
+    assert provider.peak == 3
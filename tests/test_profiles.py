@@ -0,0 +1,110 @@
+"""``/profile`` ETags and optimistic concurrency, and ``CachedProfileStore`` on conflict."""
+import asyncio
+import uuid
+
+import httpx
+import pytest
+
+import index
+from _profiles import CachedProfileStore, ProfileVersionConflict, SQLiteProfileStore
+
+PROFILE = {
+    "firstName": "Asha",
+    "lastName": "Kulkarni",
+    "email": "asha@example.com",
+    "mobile": "+91 90000 00000",
+    "city": "Nashik",
+    "state": "Maharashtra",
+    "country": "India",
+}
+
+
+@pytest.fixture
+def user():
+    return {"X-User-Id": f"test-{uuid.uuid4().hex}"}
+
+
+def test_new_user_reads_default_profile_at_version_0(client, user):
+    response = client.get("/profile", headers=user)
+    assert response.status_code == 200
+    assert response.headers["ETag"] == '"v0"'
+    assert response.json() == index.mock_user_profile
+
+
+def test_if_none_match_returns_304_only_for_the_current_etag(client, user):
+    assert client.get("/profile", headers={**user, "If-None-Match": '"v0"'}).status_code == 304
+    assert client.get("/profile", headers={**user, "If-None-Match": 'W/"v0", "v7"'}).status_code == 304
+    assert client.get("/profile", headers={**user, "If-None-Match": '"v1"'}).status_code == 200
+
+
+def test_if_match_with_current_etag_succeeds(client, user):
+    response = client.put("/profile", json=PROFILE, headers={**user, "If-Match": '"v0"'})
+    assert response.status_code == 200
+    assert response.headers["ETag"] == '"v1"'
+    fetched = client.get("/profile", headers=user)
+    assert fetched.json() == PROFILE and fetched.headers["ETag"] == '"v1"'
+
+
+def test_stale_if_match_is_412_with_current_etag(client, user):
+    client.put("/profile", json=PROFILE, headers=user)
+    client.put("/profile", json=dict(PROFILE, city="Pune"), headers=user)
+    response = client.put("/profile", json=dict(PROFILE, city="Nagpur"), headers={**user, "If-Match": '"v1"'})
+    assert response.status_code == 412
+    assert response.headers["ETag"] == '"v2"'
+    assert client.get("/profile", headers=user).json()["city"] == "Pune"
+
+
+@pytest.mark.parametrize("if_match", ["v1", '"1"', '"vx"', "garbage"])
+def test_malformed_if_match_is_412(client, user, if_match):
+    response = client.put("/profile", json=PROFILE, headers={**user, "If-Match": if_match})
+    assert response.status_code == 412
+    assert client.get("/profile", headers=user).headers["ETag"] == '"v0"'
+
+
+def test_unconditional_and_wildcard_puts_always_write(client, user):
+    assert client.put("/profile", json=PROFILE, headers=user).headers["ETag"] == '"v1"'
+    assert client.put("/profile", json=PROFILE, headers={**user, "If-Match": "*"}).headers["ETag"] == '"v2"'
+
+
+@pytest.mark.parametrize("writers", [2, 8])
+def test_racing_puts_with_the_same_if_match_have_one_winner(user, writers):
+    async def scenario():
+        transport = httpx.ASGITransport(app=index.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            etag = (await client.get("/profile", headers=user)).headers["ETag"]
+            responses = await asyncio.gather(*(
+                client.put("/profile", json=dict(PROFILE, city=f"City {i}"), headers={**user, "If-Match": etag})
+                for i in range(writers)
+            ))
+            return responses, await client.get("/profile", headers=user)
+
+    responses, final = asyncio.run(scenario())
+    statuses = sorted(response.status_code for response in responses)
+    assert statuses == [200] + [412] * (writers - 1)
+    winner = next(response for response in responses if response.status_code == 200)
+    assert final.headers["ETag"] == winner.headers["ETag"] == '"v1"'
+    assert final.json() == winner.json()
+    assert all(response.headers["ETag"] == '"v1"' for response in responses)
+
+
+def test_cached_store_drops_its_entry_on_conflict(tmp_path):
+    async def scenario():
+        backing = SQLiteProfileStore(str(tmp_path / "profiles.sqlite3"), {"city": "Default"})
+        cached = CachedProfileStore(backing, ttl=3600)
+        assert await cached.get("u") == ({"city": "Default"}, 0)
+
+        # Another worker process writes behind this cache's back.
+        await backing.put("u", {"city": "Pune"})
+        assert await cached.get("u") == ({"city": "Default"}, 0)  # still cached
+
+        with pytest.raises(ProfileVersionConflict) as conflict:
+            await cached.put("u", {"city": "Nashik"}, expected_version=0)
+        assert conflict.value.current_version == 1
+        assert "u" not in cached._entries
+        assert await cached.get("u") == ({"city": "Pune"}, 1)
+
+        assert await cached.put("u", {"city": "Nashik"}, expected_version=1) == 2
+        assert await cached.get("u") == ({"city": "Nashik"}, 2)
+        assert cached.stats()["misses"] == 2
+
+    asyncio.run(scenario())
@@ -0,0 +1,42 @@
+"""``/recommend`` answers non-finite readings with finite scores instead of a 500."""
+import json
+import math
+
+import pytest
+
+from conftest import SAMPLE_INPUT
+
+
+def assert_valid_ranking(recommendations, k):
+    assert len(recommendations) == k
+    for item in recommendations:
+        assert math.isfinite(item["score"]) and 0.0 <= item["score"] <= 1.0
+
+
+@pytest.mark.parametrize("reading", ["nan", "inf", "-inf"])
+@pytest.mark.parametrize("field", ["temperature", "rainfall", "phLevel"])
+def test_non_finite_reading_is_scored(client, field, reading):
+    response = client.post("/recommend?k=3", json=dict(SAMPLE_INPUT, **{field: reading}))
+    assert response.status_code == 200
+    assert_valid_ranking(response.json()["recommendations"], 3)
+
+
+def test_nan_reading_does_not_count_against_any_crop(client):
+    finite = client.post("/recommend?k=5", json=dict(SAMPLE_INPUT, temperature=25.0)).json()
+    unknown = client.post("/recommend?k=5", json=dict(SAMPLE_INPUT, temperature="nan")).json()
+    best = max(item["score"] for item in finite["recommendations"])
+    assert unknown["recommendations"][0]["score"] >= best
+
+
+def test_one_non_finite_row_does_not_fail_the_batch(client):
+    rows = [dict(SAMPLE_INPUT, temperature="nan"), SAMPLE_INPUT, dict(SAMPLE_INPUT, rainfall="inf")]
+    response = client.post(
+        "/recommend/batch?k=2",
+        content="\n".join(json.dumps(row) for row in rows),
+        headers={"content-type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    results = response.json()
+    assert len(results) == 3
+    for row in results:
+        assert_valid_ranking(row["recommendations"], 2)
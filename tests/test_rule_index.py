@@ -0,0 +1,115 @@
+"""Parity of the compiled rule index with a straightforward rule evaluator.
+
+``RuleIndex`` must return, for every row, the first rule whose conditions
+all hold (or the default), whether it is queried one row at a time or with
+columns, and the batch encoding must match the single-row response bytes.
+"""
+import json
+import math
+import operator
+import os
+import random
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "api"))
+
+from _catalog import encode_json, load_crop_details
+from _predict import CATEGORICAL_FIELDS, NUMERIC_FIELDS, RuleIndex, load_rule_set
+
+RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "api", "rules.json")
+SOIL_TYPES = ["Clay", "Loam", "Silt", "Sandy", "Red", "Peat", "Black"]
+COMPARE = {"gt": operator.gt, "ge": operator.ge, "lt": operator.lt, "le": operator.le}
+
+
+def naive_predict(rules, default, row):
+    for rule in rules:
+        holds = True
+        for field, condition in rule.get("when", {}).items():
+            value = row[field]
+            for op, bound in condition.items():
+                if op == "eq":
+                    holds = value == bound
+                elif op == "in":
+                    holds = value in bound
+                else:
+                    holds = COMPARE[op](value, float(bound))
+                if not holds:
+                    break
+            if not holds:
+                break
+        if holds:
+            return rule["crop"]
+    return default
+
+
+def random_rows(rules, count, seed):
+    """Random readings, with rule thresholds and NaN mixed in so every bucket edge is hit."""
+    rng = random.Random(seed)
+    thresholds = {field: [0.0] for field in NUMERIC_FIELDS}
+    for rule in rules:
+        for field, condition in rule.get("when", {}).items():
+            if field in thresholds:
+                thresholds[field] += [float(bound) for bound in condition.values()]
+    rows = []
+    for _ in range(count):
+        row = {}
+        for field in NUMERIC_FIELDS:
+            pick = rng.random()
+            if pick < 0.3:
+                row[field] = rng.choice(thresholds[field])
+            elif pick < 0.32:
+                row[field] = math.nan
+            else:
+                row[field] = round(rng.uniform(-10, max(thresholds[field]) * 1.2 + 10), 2)
+        row["soilType"] = rng.choice(SOIL_TYPES)
+        rows.append(row)
+    return rows
+
+
+def synthetic_rules(count, seed):
+    rng = random.Random(seed)
+    rules = []
+    for i in range(count):
+        when = {}
+        for field in rng.sample(NUMERIC_FIELDS, rng.randint(1, 3)):
+            when[field] = {rng.choice(list(COMPARE)): rng.choice([10, 20, 25, 30, 50, 100])
+                           for _ in range(rng.randint(1, 2))}
+        if rng.random() < 0.3:
+            when["soilType"] = {"in": rng.sample(SOIL_TYPES, 2)}
+        rules.append({"crop": f"Crop {i}", "when": when})
+    return rules
+
+
+@pytest.fixture(scope="module")
+def shipped_rules():
+    return load_rule_set(RULES_PATH, load_crop_details())
+
+
+def check_parity(rules, default, rows):
+    index = RuleIndex(rules, default)
+    expected = [naive_predict(rules, default, row) for row in rows]
+    assert [index.predict(SimpleNamespace(**row)) for row in rows] == expected
+
+    columns = {field: [row[field] for row in rows] for field in NUMERIC_FIELDS + CATEGORICAL_FIELDS}
+    indices = index.predict_columns(columns)
+    assert index.crop_names(indices) == expected
+    assert index.encode_results(indices) == b"[" + b",".join(encode_json({"suggested_crop": c}) for c in expected) + b"]"
+    assert json.loads(index.encode_results(indices)) == [{"suggested_crop": c} for c in expected]
+
+
+def test_shipped_rules_match_naive_evaluation(shipped_rules):
+    rules, default = shipped_rules
+    check_parity(rules, default, random_rows(rules, 5000, seed=0))
+
+
+@pytest.mark.parametrize("count", [1, 63, 64, 65, 300])
+def test_synthetic_rules_match_naive_evaluation(count):
+    rules = synthetic_rules(count, seed=count)
+    check_parity(rules, "Fallback", random_rows(rules, 2000, seed=count))
+
+
+def test_empty_rule_set_returns_default():
+    check_parity([], "Maize", random_rows([], 50, seed=1))
@@ -0,0 +1,72 @@
+"""Malformed rule files are rejected with ``ValueError`` and never replace a working index."""
+import json
+import os
+
+import pytest
+
+import index
+from _predict import RuleEngine, load_rule_set
+
+GOOD_SPEC = {"default": "Maize", "rules": [{"crop": "Rice", "when": {"rainfall": {"gt": 1000}}}]}
+
+MALFORMED_SPECS = {
+    "top level is a list": [GOOD_SPEC],
+    "rules is not a list": {"rules": {"crop": "Rice"}},
+    "rule is not an object": {"rules": [1]},
+    "rule without crop": {"rules": [{"when": {}}]},
+    "when is a list": {"rules": [{"crop": "Rice", "when": [1]}]},
+    "condition is not an object": {"rules": [{"crop": "Rice", "when": {"rainfall": [1000]}}]},
+    "string operand": {"rules": [{"crop": "Rice", "when": {"rainfall": {"gt": "1000"}}}]},
+    "bool operand": {"rules": [{"crop": "Rice", "when": {"rainfall": {"gt": True}}}]},
+    "unknown field": {"rules": [{"crop": "Rice", "when": {"altitude": {"gt": 100}}}]},
+    "unknown operator": {"rules": [{"crop": "Rice", "when": {"rainfall": {"between": 1}}}]},
+    "non-string soilType eq": {"rules": [{"crop": "Rice", "when": {"soilType": {"eq": 5}}}]},
+    "non-string soilType in": {"rules": [{"crop": "Rice", "when": {"soilType": {"in": ["Clay", 1]}}}]},
+    "soilType in is not a list": {"rules": [{"crop": "Rice", "when": {"soilType": {"in": "Clay"}}}]},
+    "default is not a string": {"rules": [], "default": 3},
+}
+
+
+def write_spec(path, spec, mtime):
+    path.write_text(spec if isinstance(spec, str) else json.dumps(spec), encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def rule_path(tmp_path):
+    path = tmp_path / "rules.json"
+    write_spec(path, GOOD_SPEC, 1_000_000)
+    return path
+
+
+@pytest.mark.parametrize("spec", list(MALFORMED_SPECS.values()) + ["{not json"], ids=list(MALFORMED_SPECS) + ["invalid json"])
+def test_malformed_spec_raises_value_error(rule_path, spec):
+    write_spec(rule_path, spec, 1_000_001)
+    with pytest.raises(ValueError):
+        load_rule_set(str(rule_path), {})
+
+
+@pytest.mark.parametrize("spec", list(MALFORMED_SPECS.values()), ids=list(MALFORMED_SPECS))
+def test_engine_keeps_previous_index_on_malformed_file(rule_path, spec):
+    engine = RuleEngine(str(rule_path), {}, check_interval=0)
+    previous = engine.index
+    assert previous.crops == ["Rice", "Maize"]
+
+    write_spec(rule_path, spec, 1_000_001)
+    assert engine.index is previous
+
+    fixed = dict(GOOD_SPEC, default="Wheat")
+    write_spec(rule_path, fixed, 1_000_002)
+    assert engine.index.crops == ["Rice", "Wheat"]
+
+
+def test_reload_endpoint_rejects_malformed_file_with_422(client, rule_path, monkeypatch):
+    engine = RuleEngine(str(rule_path), {}, check_interval=3600)
+    monkeypatch.setattr(index, "rule_engine", engine)
+    assert client.post("/rules/reload").json() == {"status": "ok", "rules": 1, "default": "Maize"}
+
+    write_spec(rule_path, MALFORMED_SPECS["when is a list"], 1_000_001)
+    response = client.post("/rules/reload")
+    assert response.status_code == 422
+    assert response.json()["detail"].startswith("Rule set not reloaded:")
+    assert client.get("/rules").json()["default"] == "Maize"
@@ -0,0 +1,119 @@
+"""``AsyncTTLCache``: coalescing, expiry, eviction and ``clear``."""
+import asyncio
+
+import pytest
+
+from _insights import AsyncTTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Source:
+    """Compute functions that count calls and can be held until released."""
+
+    def __init__(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    def value(self, result):
+        async def compute():
+            self.calls += 1
+            return result
+        return compute
+
+    def gated(self, result):
+        async def compute():
+            self.calls += 1
+            await self.release.wait()
+            return result
+        return compute
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_concurrent_lookups_share_one_computation():
+    async def scenario():
+        cache, source = AsyncTTLCache(), Source()
+        waiters = [asyncio.ensure_future(cache.get_or_compute("k", source.gated(i))) for i in range(5)]
+        await asyncio.sleep(0)
+        source.release.set()
+        assert await asyncio.gather(*waiters) == [0] * 5
+        assert source.calls == 1
+        assert (cache.misses, cache.coalesced) == (1, 4)
+        assert cache._inflight == {}
+
+    run(scenario())
+
+
+def test_entries_expire_after_ttl():
+    async def scenario():
+        clock, source = FakeClock(), Source()
+        cache = AsyncTTLCache(ttl=10, clock=clock)
+        assert await cache.get_or_compute("k", source.value("first")) == "first"
+        clock.now = 9.9
+        assert await cache.get_or_compute("k", source.value("second")) == "first"
+        clock.now = 10.0
+        assert await cache.get_or_compute("k", source.value("second")) == "second"
+        assert source.calls == 2
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    run(scenario())
+
+
+def test_least_recently_used_entry_is_evicted():
+    async def scenario():
+        cache, source = AsyncTTLCache(maxsize=2), Source()
+        await cache.get_or_compute("a", source.value("a"))
+        await cache.get_or_compute("b", source.value("b"))
+        await cache.get_or_compute("a", source.value("a"))  # a is now the most recent
+        await cache.get_or_compute("c", source.value("c"))
+        assert list(cache._entries) == ["a", "c"]
+        assert await cache.get_or_compute("b", source.value("b2")) == "b2"
+
+    run(scenario())
+
+
+def test_failed_computation_is_not_cached():
+    async def scenario():
+        cache, source = AsyncTTLCache(), Source()
+
+        async def fail():
+            raise RuntimeError("upstream down")
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_compute("k", fail)
+        assert cache._inflight == {} and len(cache._entries) == 0
+        assert await cache.get_or_compute("k", source.value("ok")) == "ok"
+
+    run(scenario())
+
+
+def test_result_computed_before_clear_is_not_cached():
+    async def scenario():
+        cache, old, new = AsyncTTLCache(), Source(), Source()
+        stale = asyncio.ensure_future(cache.get_or_compute("k", old.gated("old")))
+        await asyncio.sleep(0)
+        cache.clear()
+
+        # A lookup after the clear starts its own computation instead of coalescing.
+        fresh = asyncio.ensure_future(cache.get_or_compute("k", new.gated("new")))
+        await asyncio.sleep(0)
+        old.release.set()
+        assert await stale == "old"  # its own waiters still get an answer
+        assert "k" not in cache._entries
+        assert "k" in cache._inflight  # the stale task did not remove the fresh one
+
+        new.release.set()
+        assert await fresh == "new"
+        assert await cache.get_or_compute("k", old.value("again")) == "new"
+        assert cache._inflight == {}
+
+    run(scenario())